@@ -0,0 +1,43 @@
+#! /usr/bin/env python
+'''Measure how long it takes a fresh interpreter to import gcrawl. Every qless
+worker and pool process pays this, so it should stay small and predictable:
+
+    python bench/importtime.py [runs]
+
+It reports the time for a bare interpreter alongside the time to
+`import gcrawl`, and to `import gcrawl; gcrawl.init()`.'''
+
+import os
+import sys
+import time
+import subprocess
+
+# Make sure we're timing the checkout this lives in
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+    p for p in (root, os.environ.get('PYTHONPATH')) if p))
+
+cases = [
+    ('interpreter'  , 'pass'),
+    ('import'       , 'import gcrawl'),
+    ('import + init', 'import gcrawl; gcrawl.init()')
+]
+
+
+def timeit(code, runs):
+    '''Run `code` in `runs` fresh interpreters, returning the wall times'''
+    times = []
+    for i in range(runs):
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', code], env=env)
+        times.append(time.time() - start)
+    return sorted(times)
+
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print '%-15s %10s %10s %10s' % ('', 'min (ms)', 'median', 'max')
+    for name, code in cases:
+        times = timeit(code, runs)
+        print '%-15s %10.1f %10.1f %10.1f' % (name,
+            times[0] * 1000, times[len(times) / 2] * 1000, times[-1] * 1000)
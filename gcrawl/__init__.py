@@ -1,19 +1,46 @@
 #! /usr/bin/env python
 
-import urllib3
-import requests
 import urlparse
+import warnings
 from .page import Page
 
-# Gevent!
-import gevent
-from gevent import sleep
-from gevent import monkey; monkey.patch_all()
-
+# Importing gcrawl is deliberately free of side effects. In particular, we
+# don't import `requests` or `gevent` here: gevent's monkey-patching has to
+# happen before anything that opens sockets is imported, so it's up to the
+# entry point to call `init()` first thing, and `run()` pulls in the rest.
 import logging
-logging.basicConfig()
 logger = logging.getLogger('gcrawl')
 logger.setLevel(logging.INFO)
+logger.addHandler(logging.NullHandler())
+
+# What `init()` has already done, so that calling it again only does the rest
+_patched = False
+_logged  = False
+
+
+def init(patch=True, log=True):
+    '''Prepare the process for crawling. This should be the very first thing
+    a worker or script does, before importing `requests`, `urllib3` or anything
+    else that might create sockets. It monkey-patches the standard library with
+    gevent (unless `patch` is False) and, if `log` is True, configures basic
+    logging. Each of these happens at most once, so calling it again is
+    harmless, and will do whichever hasn't been done yet.'''
+    global _patched, _logged
+    if patch and not _patched:
+        from gevent import monkey
+        monkey.patch_all()
+        _patched = True
+    if log and not _logged:
+        logging.basicConfig()
+        _logged = True
+
+
+def patched():
+    '''Whether sockets have been monkey-patched, by `init()` or otherwise'''
+    if _patched:
+        return True
+    from gevent import monkey
+    return monkey.is_module_patched('socket')
 
 
 class TimeoutException(Exception):
@@ -54,6 +81,17 @@ class Crawl(object):
 
     def run(self):
         '''Run the crawl!'''
+        # These are imported here rather than at module level so that importing
+        # gcrawl stays cheap, and so they come after `init()` has patched sockets
+        import gevent
+        import requests
+        if not patched():
+            # Without this, every fetch blocks the whole process and the
+            # timeouts below can't fire. This goes through `warnings` rather
+            # than the logger, which is silent until logging is configured.
+            warnings.warn('gcrawl.init() was not called before crawling, so '
+                'sockets are not patched: requests will block and timeouts '
+                'will not fire', RuntimeWarning)
         self.before()
         while self.requests and self.crawled < self.max_pages:
             url = self.pop()
@@ -84,7 +122,7 @@ class Crawl(object):
                 delay = None
                 with gevent.timeout.Timeout(self.timeout, False):
                     delay = self.delay(page)
-                    sleep(delay)
+                    gevent.sleep(delay)
                 if delay is None:
                     logger.warn('Timed out getting dealy for %s' % url)
             except Exception as exc:
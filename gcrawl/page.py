@@ -1,7 +1,16 @@
 #! /usr/bin/env python
 
 from .url import Url
-from lxml import etree
+
+# lxml is comparatively expensive to import, and a lot of processes that import
+# gcrawl never parse a page, so we hold off on it until the first time we need
+# it. Until then, `etree` stands in for lxml.etree, and loads it when used.
+class _LazyEtree(object):
+    '''Stands in for lxml.etree, importing it on first use'''
+    def __getattr__(self, key):
+        return getattr(_lxml(), key)
+
+etree = _LazyEtree()
 
 # The XPath functions available in lxml.etree do not include a lower()
 # function, and so we have to provide it ourselves. Ugly, yes.
@@ -9,8 +18,28 @@ import string
 def lower(dummy, l):
     return [string.lower(s) for s in l]
 
-ns = etree.FunctionNamespace(None)
-ns['lower'] = lower
+_etree = None
+def _lxml():
+    '''Import lxml.etree and register our `lower` function with it, the first
+    time around. Returns the etree module.'''
+    global _etree, etree
+    if _etree is None:
+        from lxml import etree as module
+        ns = module.FunctionNamespace(None)
+        ns['lower'] = lower
+        _etree = etree = module
+    return _etree
+
+class LazyXPath(object):
+    '''An xpath that's compiled the first time it's accessed'''
+    def __init__(self, expression):
+        self.expression = expression
+        self.compiled   = None
+    
+    def __get__(self, instance, owner):
+        if self.compiled is None:
+            self.compiled = _lxml().XPath(self.expression)
+        return self.compiled
 
 class Page(object):
     # Disallowed schemes
@@ -18,18 +47,18 @@ class Page(object):
     
     # A few xpaths we use
     # Meta robots. This applies to /all/ robots, though...
-    metaRobotsXpath = etree.XPath('//meta[lower(@name)="robots"]/@content')
+    metaRobotsXpath = LazyXPath('//meta[lower(@name)="robots"]/@content')
     # The xpath for finding the base tag, if one is supplied
-    baseXpath = etree.XPath('//base[1]/@href')
+    baseXpath = LazyXPath('//base[1]/@href')
     # Links we count should:
     #   - have rel not containing nofollow
     #   - have a valid href
     #   - not start with any of our blacklisted schemes (like 'javascript', 'mailto', etc.)
     banned = ''.join('[not(starts-with(normalize-space(@href),"%s:"))]' % sc for sc in banned_schemes)
     
-    followableLinksXpath   = etree.XPath('//a[not(contains(lower(@rel),"nofollow"))]' + banned + '/@href')
-    unfollowableLinksXpath = etree.XPath('//a[contains(lower(@rel),"nofollow")]' + banned + '/@href')
-    allLinksXpath          = etree.XPath('//a' + banned + '/@href')
+    followableLinksXpath   = LazyXPath('//a[not(contains(lower(@rel),"nofollow"))]' + banned + '/@href')
+    unfollowableLinksXpath = LazyXPath('//a[contains(lower(@rel),"nofollow")]' + banned + '/@href')
+    allLinksXpath          = LazyXPath('//a' + banned + '/@href')
     
     def __init__(self, response):
         self.url      = response.url
@@ -51,9 +80,11 @@ class Page(object):
             self.content = self.response.content
             return self.content
         elif key == 'html':
+            etree = _lxml()
             self.html = etree.fromstring(self.content, etree.HTMLParser(recover=True))
             return self.html
         elif key == 'xml':
+            etree = _lxml()
             self.xml = etree.fromstring(self.content, etree.XMLParser(recover=True))
             return self.xml
         elif key == 'redirection':
@@ -1,7 +1,6 @@
 #! /usr/bin/env python
 
 import re
-import reppy
 import urllib
 import urlparse
 
@@ -80,7 +79,9 @@ class Url(object):
                 'foobot': 'index, nofollow'
             }
         '''
-        # First, check robots.txt
+        # First, check robots.txt. reppy is only needed here, so we don't pay
+        # for importing it unless we're actually checking robots.txt
+        import reppy
         r = reppy.findRobot(url)
         allowed = (r == None) or r.allowed(url, useragent)
         
@@ -0,0 +1,56 @@
+#! /usr/bin/env python
+'''Run `qless-py-worker` with gcrawl set up first. By the time a job module is
+imported by `qless-py-worker`, redis and qless have already been imported, and
+it's too late to monkey-patch. So instead of invoking `qless-py-worker`
+directly, use this (installed as `gcrawl-worker`), which takes exactly the
+same arguments:
+
+    gcrawl-worker --queue crawl --greenlets 100
+
+It calls `gcrawl.init()`, and only then loads and runs `qless-py-worker`.'''
+
+import os
+import sys
+
+from . import init, logger
+
+# The name of the script that qless-py installs
+script = 'qless-py-worker'
+
+
+def find(name):
+    '''Find the path to the named script, or None. We look next to the
+    interpreter and next to the script we were invoked as (which is where a
+    virtualenv puts both gcrawl-worker and qless-py-worker), and only then on
+    the PATH. Process managers often start us by absolute path with a minimal
+    PATH, and we'd rather not pick up some other installation's script.'''
+    directories = [
+        os.path.dirname(sys.executable),
+        os.path.dirname(os.path.abspath(sys.argv[0]))
+    ] + os.environ.get('PATH', '').split(os.pathsep)
+    for directory in directories:
+        path = os.path.join(directory, name)
+        if os.path.isfile(path) and os.access(path, os.X_OK):
+            return path
+    return None
+
+
+def main(argv=None):
+    '''Initialize gcrawl, and then hand off to `qless-py-worker`'''
+    init()
+
+    path = find(script)
+    if path is None:
+        logger.error('Could not find %s alongside %s, %s or on the PATH. '
+            'Is qless-py installed?' % (script, sys.executable, sys.argv[0]))
+        sys.exit(1)
+
+    # qless-py-worker is a script rather than a module, so run it in-process
+    # (after we've patched) as though it had been invoked with our arguments
+    import runpy
+    sys.argv = [path] + list(sys.argv[1:] if argv is None else argv)
+    runpy.run_path(path, run_name='__main__')
+
+
+if __name__ == '__main__':
+    main()
@@ -24,7 +24,10 @@
 try:
 	from setuptools import setup
 	extra = {
-		'install_requires' : ['reppy', 'urllib3', 'requests', 'gevent']
+		'install_requires' : ['reppy', 'urllib3', 'requests', 'gevent'],
+		'entry_points'     : {
+			'console_scripts': ['gcrawl-worker = gcrawl.worker:main']
+		}
 	}
 except ImportError:
 	from distutils.core import setup
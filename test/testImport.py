@@ -0,0 +1,100 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+import unittest
+import subprocess
+
+class TestImport(unittest.TestCase):
+    # Each of these runs in a fresh interpreter, since this one has almost
+    # certainly imported gcrawl (and whatever else) already. The snippets
+    # exit with a message describing what went wrong, so it shows up here
+    def check(self, *lines):
+        p = subprocess.Popen([sys.executable, '-c', '\n'.join(lines)],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        out = p.communicate()[0]
+        self.assertEqual(p.returncode, 0, out)
+    
+    def test_no_heavy_imports(self):
+        '''Importing gcrawl shouldn't pull in the network or parsing stacks'''
+        self.check(
+            'import sys, gcrawl',
+            'heavy = ("gevent", "requests", "urllib3", "lxml", "reppy")',
+            'loaded = [m for m in heavy if m in sys.modules]',
+            'if loaded: sys.exit("Imported %s" % ", ".join(loaded))')
+    
+    def test_no_logging_config(self):
+        '''Importing gcrawl shouldn't configure logging for the process'''
+        self.check(
+            'import sys, logging, gcrawl',
+            'if logging.getLogger().handlers: sys.exit("Root logger configured")')
+    
+    def test_no_monkey_patching(self):
+        '''Sockets should only be patched once `init()` is called'''
+        self.check(
+            'import sys, socket, gcrawl',
+            'if socket.socket.__module__ != "socket" or gcrawl.patched():',
+            '    sys.exit("socket.socket is from %s" % socket.socket.__module__)')
+    
+    def test_init_patches(self):
+        '''`init()` should monkey-patch sockets'''
+        self.check(
+            'import sys, gcrawl',
+            'gcrawl.init(log=False)',
+            'import socket',
+            'if not socket.socket.__module__.startswith("gevent"):',
+            '    sys.exit("socket.socket is from %s" % socket.socket.__module__)',
+            'if not gcrawl.patched(): sys.exit("patched() is False")')
+    
+    def test_init_no_patch(self):
+        '''`init(patch=False)` should leave sockets alone'''
+        self.check(
+            'import sys, gcrawl',
+            'gcrawl.init(patch=False)',
+            'import socket',
+            'if socket.socket.__module__ != "socket" or gcrawl.patched():',
+            '    sys.exit("socket.socket is from %s" % socket.socket.__module__)')
+    
+    def test_init_logs(self):
+        '''`init()` should configure logging, and `init(log=False)` shouldn't'''
+        self.check(
+            'import sys, logging, gcrawl',
+            'gcrawl.init(patch=False, log=False)',
+            'if logging.getLogger().handlers: sys.exit("Root logger configured")')
+        self.check(
+            'import sys, logging, gcrawl',
+            'gcrawl.init(patch=False)',
+            'if not logging.getLogger().handlers: sys.exit("Root logger not configured")')
+    
+    def test_init_repeated(self):
+        '''Calling `init()` again should do whatever wasn't done the first time'''
+        self.check(
+            'import sys, gcrawl',
+            'gcrawl.init(patch=False)',
+            'gcrawl.init(log=False)',
+            'if not gcrawl.patched(): sys.exit("Not patched")')
+        self.check(
+            'import sys, logging, gcrawl',
+            'gcrawl.init(log=False)',
+            'gcrawl.init(patch=False)',
+            'if not logging.getLogger().handlers: sys.exit("Root logger not configured")')
+    
+    def test_run_warns_unpatched(self):
+        '''Crawling without `init()` should warn that sockets aren't patched'''
+        self.check(
+            'import sys, warnings, gcrawl',
+            'with warnings.catch_warnings(record=True) as caught:',
+            '    warnings.simplefilter("always")',
+            '    gcrawl.Crawl("http://localhost/", max_pages=0).run()',
+            'if not [w for w in caught if issubclass(w.category, RuntimeWarning)]:',
+            '    sys.exit("No warning")')
+        self.check(
+            'import sys, warnings, gcrawl',
+            'gcrawl.init(log=False)',
+            'with warnings.catch_warnings(record=True) as caught:',
+            '    warnings.simplefilter("always")',
+            '    gcrawl.Crawl("http://localhost/", max_pages=0).run()',
+            'caught = [w for w in caught if issubclass(w.category, RuntimeWarning)]',
+            'if caught: sys.exit("Warned: %s" % caught[0].message)')
+
+unittest.main()
@@ -0,0 +1,99 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+import unittest
+import subprocess
+from gcrawl.page import Page
+
+class Response(object):
+    '''Just enough of a requests.Response to make a Page out of'''
+    def __init__(self, content, url='http://foo.com/bar/', status_code=200, headers=None):
+        self.url         = url
+        self.status_code = status_code
+        self.headers     = headers or {}
+        self.content     = content
+
+class TestPage(unittest.TestCase):
+    def page(self, body, head='', **kwargs):
+        return Page(Response(
+            '<html><head>%s</head><body>%s</body></html>' % (head, body), **kwargs))
+    
+    def test_follow_nofollow(self):
+        '''Links should be split on rel=nofollow, regardless of case'''
+        page = self.page('''
+            <a href="/about">About</a>
+            <a href="howdy">Howdy</a>
+            <a href="http://bar.com/" rel="NoFollow">Bar</a>
+            <a href="/private" rel="external nofollow">Private</a>''')
+        self.assertEqual(page.links['follow'],
+            ['http://foo.com/about', 'http://foo.com/bar/howdy'])
+        self.assertEqual(page.links['nofollow'],
+            ['http://bar.com/', 'http://foo.com/private'])
+    
+    def test_banned_schemes(self):
+        '''mailto:, javascript: and tel: links aren't links at all'''
+        page = self.page('''
+            <a href="mailto:dan@foo.com">Email</a>
+            <a href=" javascript:void(0)">Script</a>
+            <a href="tel:5555555555" rel="nofollow">Call</a>
+            <a href="/about">About</a>''')
+        self.assertEqual(page.links['follow'], ['http://foo.com/about'])
+        self.assertEqual(page.links['nofollow'], [])
+    
+    def test_meta_robots_nofollow(self):
+        '''Meta robots nofollow makes every link nofollow'''
+        page = self.page('''
+            <a href="/about">About</a>
+            <a href="/private" rel="nofollow">Private</a>''',
+            head='<meta name="ROBOTS" content="noindex, nofollow">')
+        self.assertEqual(page.links['follow'], [])
+        self.assertEqual(page.links['nofollow'],
+            ['http://foo.com/about', 'http://foo.com/private'])
+    
+    def test_base(self):
+        '''Relative links should be resolved against <base>, if provided'''
+        page = self.page('<a href="howdy">Howdy</a>',
+            head='<base href="http://bar.com/foo/">')
+        self.assertEqual(page.links['follow'], ['http://bar.com/foo/howdy'])
+    
+    def test_html_xml(self):
+        '''The html and xml attributes should be parsed trees'''
+        page = self.page('<p>Hello</p>')
+        self.assertEqual(page.html.xpath('//p/text()'), ['Hello'])
+        self.assertEqual(page.xml.xpath('//p/text()'), ['Hello'])
+    
+    def test_redirection(self):
+        '''Redirection comes from the Location header, or failing that, Refresh'''
+        page = self.page('', status_code=301, headers={'location': '/moved'})
+        self.assertEqual(page.redirection, 'http://foo.com/moved')
+        page = self.page('', headers={'refresh': '0; url=/refreshed'})
+        self.assertEqual(page.redirection, 'http://foo.com/refreshed')
+    
+    def check(self, *lines):
+        '''Run these lines in a fresh interpreter, where nothing has been parsed'''
+        p = subprocess.Popen([sys.executable, '-c', '\n'.join(lines)],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        out = p.communicate()[0]
+        self.assertEqual(p.returncode, 0, out)
+    
+    def test_xpaths_before_parsing(self):
+        '''The class-level xpaths should be usable before any page is parsed'''
+        self.check(
+            'import sys',
+            'from gcrawl.page import Page',
+            'from lxml import etree',
+            'tree = etree.fromstring("<html><a href=\\"/a\\" rel=\\"nofollow\\"/></html>")',
+            'if Page.allLinksXpath(tree) != ["/a"]: sys.exit("allLinksXpath failed")',
+            'if Page.unfollowableLinksXpath(tree) != ["/a"]: sys.exit("unfollowableLinksXpath failed")',
+            'if Page.followableLinksXpath(tree) != []: sys.exit("followableLinksXpath failed")')
+    
+    def test_etree_before_parsing(self):
+        '''gcrawl.page.etree should work as lxml.etree, without loading it early'''
+        self.check(
+            'import sys',
+            'from gcrawl.page import etree',
+            'if "lxml" in sys.modules: sys.exit("Imported lxml")',
+            'if etree.fromstring("<a>b</a>").text != "b": sys.exit("fromstring failed")')
+
+unittest.main()
@@ -0,0 +1,80 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+# Stands in for qless-py-worker, which checks that by the time it runs, sockets
+# have been patched, and that it got the arguments we passed to gcrawl-worker
+fake = '''#! /usr/bin/env python
+import sys, socket
+if not socket.socket.__module__.startswith('gevent'):
+    sys.exit('socket.socket is from %s' % socket.socket.__module__)
+if sys.argv[1:] != ['--queue', 'crawl']:
+    sys.exit('Got arguments %s' % sys.argv[1:])
+'''
+
+class TestWorker(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        # Directories we can put a qless-py-worker in, and one that's empty
+        self.bin   = self.mkdir('bin', fake)
+        self.other = self.mkdir('other', 'import sys; sys.exit("Ran the wrong qless-py-worker")')
+        self.empty = self.mkdir('empty')
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+    
+    def mkdir(self, name, script=None):
+        '''Make a directory, with a qless-py-worker in it if provided'''
+        directory = os.path.join(self.tmp, name)
+        os.mkdir(directory)
+        if script is not None:
+            self.write(os.path.join(directory, 'qless-py-worker'), script)
+        return directory
+    
+    def write(self, path, content):
+        with open(path, 'w') as f:
+            f.write(content)
+        os.chmod(path, 0755)
+    
+    def worker(self, path, command=None):
+        '''Run gcrawl-worker with the provided PATH, returning its exit status
+        and output'''
+        command = command or [sys.executable, '-m', 'gcrawl.worker']
+        p = subprocess.Popen(command + ['--queue', 'crawl'],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            env=dict(os.environ, PATH=path))
+        out = p.communicate()[0]
+        return p.returncode, out
+    
+    def test_patches_before_qless(self):
+        '''The worker should patch, and then run qless-py-worker'''
+        code, out = self.worker(self.bin + os.pathsep + os.environ.get('PATH', ''))
+        self.assertEqual(code, 0, out)
+    
+    def test_next_to_script(self):
+        '''A qless-py-worker next to the console script beats one on the PATH'''
+        script = os.path.join(self.bin, 'gcrawl-worker')
+        self.write(script, 'from gcrawl.worker import main; main()')
+        code, out = self.worker(self.other, [sys.executable, script])
+        self.assertEqual(code, 0, out)
+    
+    def test_next_to_interpreter(self):
+        '''A qless-py-worker next to the interpreter beats one on the PATH'''
+        python = os.path.join(self.bin, 'python')
+        os.symlink(sys.executable, python)
+        code, out = self.worker(self.other, [python, '-m', 'gcrawl.worker'])
+        self.assertEqual(code, 0, out)
+    
+    def test_missing_qless(self):
+        '''Without qless-py-worker anywhere, the worker should fail loudly'''
+        code, out = self.worker(self.empty)
+        self.assertNotEqual(code, 0)
+        self.assertIn('qless-py-worker', out)
+
+unittest.main()